@@ -0,0 +1,6 @@
+def pytest_configure(config):
+    # Tests marked with coverage exercise each code path of the builder once, so that a
+    # separate, traced run of only those tests is enough to measure coverage. See README.md.
+    config.addinivalue_line(
+        "markers", "coverage: canonical test for a code path, run under coverage"
+    )
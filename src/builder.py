@@ -1,20 +1,80 @@
 from collections.abc import Callable, Iterable, MutableMapping, Sequence
-from operator import add, mul
-from graphkit import compose, operation
-from graphkit.base import Operation
-from graphkit.network import DataPlaceholderNode
-from io import BytesIO
+from enum import IntEnum
+from functools import partial
+from typing import Final
+from operator import add, attrgetter, mul
 from .node import Node
 
 
+import itertools
+import logging
 import math
-import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
 import os
+import subprocess
 import sys
 import pydot
 
 
+logger = logging.getLogger("compygraph.builder")
+
+
+class ErrorCode(IntEnum):
+    """
+    Codes for the errors and failed constraints reported by the builder.
+
+    Raised exceptions carry their code as the code attribute, and logged messages carry it as
+    the code attribute of the log record.
+    """
+
+    NO_OPERATIONS = 1
+    UNDEFINED_NODE = 2
+    FAILED_EXPECTATION = 3
+    FAILED_ASSERTION = 4
+    NODE_NOT_IN_GRAPH = 5
+    OPERAND_NOT_IN_GRAPH = 6
+    UNSUPPORTED_PLOT_FILE_EXTENSION = 7
+    UNSUPPORTED_LAYOUT_QUALITY = 8
+    MISMATCHED_FILL_VALUES = 9
+
+
+# Messages that are logged or raised by the builder, as format strings for str.format().
+NO_OPERATIONS_MSG: Final[str] = (
+    "No operations in graph. Cannot run graph without any operations defined."
+)
+UNDEFINED_NODE_MSG: Final[str] = (
+    "Node {label} is undefined. Must define node in order to check constraints."
+)
+FAILED_EXPECTATION_MSG: Final[str] = (
+    "Node {label} has an expected value of {expected}, but this does not match the calculated value of {calculated}"
+)
+FAILED_ASSERTION_MSG: Final[str] = (
+    "Node {label} has failed assertion that node {a_label} and node {b_label} are equal."
+)
+NODE_NOT_IN_GRAPH_MSG: Final[str] = "Node {name} isn't in graph. Cannot set its value."
+INVALID_OPERAND_MSG: Final[str] = (
+    "Node {name} isn't in graph. Unable to add the {op_name} operation."
+)
+UNSUPPORTED_PLOT_FILE_EXTENSION_MSG: Final[str] = (
+    "Unknown file format for saving graph: {ext}"
+)
+UNSUPPORTED_LAYOUT_QUALITY_MSG: Final[str] = (
+    "Unknown layout quality for plotting graph: {layout_quality}"
+)
+MISMATCHED_FILL_VALUES_MSG: Final[str] = (
+    "Got {values_count} values for {nodes_count} nodes. Cannot set their values."
+)
+
+# Checks equality of two numbers. The default tolerance is 1e-09 - https://docs.python.org/3/library/math.html#math.isclose.
+# Equality operations call math.isclose directly rather than through a Builder method, which
+# avoids an extra Python frame per call and keeps the operations free of references to the
+# Builder.
+_equal = math.isclose
+
+# Source of graph IDs, so that nodes can be checked against their Builder graph without the
+# graph keeping a set of all of its nodes.
+_GRAPH_IDS = itertools.count()
+
+
 class InvalidNodeArgument(Exception):
     """
     Used for attempts to add operations on invalid nodes.
@@ -23,8 +83,11 @@ class InvalidNodeArgument(Exception):
     defined in the current graph.
     """
 
-    def __init__(self, message):
+    def __init__(
+        self, message: str, code: ErrorCode = ErrorCode.OPERAND_NOT_IN_GRAPH
+    ) -> None:
         super().__init__(message)
+        self.code = code
 
 
 class UnsupportedPlotFileExtension(Exception):
@@ -32,8 +95,44 @@ class UnsupportedPlotFileExtension(Exception):
     Used for attempts to create a plot file with an unsupported file extension.
     """
 
-    def __init__(self, message):
+    def __init__(
+        self, message: str, code: ErrorCode = ErrorCode.UNSUPPORTED_PLOT_FILE_EXTENSION
+    ) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+class UnsupportedLayoutQuality(Exception):
+    """
+    Used for attempts to plot a graph with an unsupported layout quality.
+    """
+
+    def __init__(
+        self, message: str, code: ErrorCode = ErrorCode.UNSUPPORTED_LAYOUT_QUALITY
+    ) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+class MismatchedFillValues(Exception):
+    """
+    Used for attempts to fill a different number of nodes and values.
+    """
+
+    def __init__(
+        self, message: str, code: ErrorCode = ErrorCode.MISMATCHED_FILL_VALUES
+    ) -> None:
         super().__init__(message)
+        self.code = code
+
+
+# Graphviz graph attributes for each supported plot layout quality. The "fast" layout caps the
+# network simplex and crossing minimization iterations and draws edges as straight lines, which
+# skips the most expensive steps of laying out large graphs.
+_LAYOUT_QUALITY_TO_GRAPH_ATTRIBUTES = {
+    "best": {},
+    "fast": {"nslimit": "0.5", "mclimit": "0.5", "splines": "line"},
+}
 
 
 # Computational graph builder that supports basic operations like addition and
@@ -42,7 +141,7 @@ class UnsupportedPlotFileExtension(Exception):
 # Currently supports ints and floats, but not complex numerical types.
 class Builder:
     """
-    A wrapper around graphkit for computational graphs.
+    A builder for computational graphs.
 
     This class abstracts away tracking nodes and handling operations with relationships
     defined between nodes in a computational graph. Provides convenience functions for
@@ -64,18 +163,47 @@ class Builder:
     current_operation_id : int
         ID of the operation that is guaranteed to be unique within a Builder graph - increaments
         on addition of any new operation
-    operations : list[Operation]
-        the list of operations that will be computed within the graph
-    assertion_node_id_to_nodes : MutableMapping[str, list[Node | int | float]]
-        mapping of the Node ID of an assertion node to its list of nodes operands - used for outputting
-        human-readable node labels of its operand nodes
+    operations : list[tuple[str, tuple[str, ...], str, Callable]]
+        the list of operations that will be computed within the graph, each as its operation ID,
+        operand node IDs, result node ID, and function - always in topological order, since an
+        operation can only be added once its operands exist and its result node is always new
+    assertion_node_id_to_labels : MutableMapping[str, tuple[str, str]]
+        mapping of the Node ID of an assertion node to the human-readable labels of its two operand
+        nodes - used for outputting failed assertions
     inputs : MutableMapping[str, int | float | None]
-        mapping of Node ID to input values
-    nodes : set[Node]
-        set of all Nodes in the graph - used to guarantee uniqueness of nodes to the graph
+        mapping of Node ID to the values of input and constant nodes - input nodes map to None
+        until they are filled
+    filled_values : MutableMapping[str, int | float]
+        mapping of Node ID to the values set with fill_nodes() - used as inputs or as expected values
+        when running the graph, and appended to the node's label when it's output
+    graph_id : int
+        ID of the graph that is unique across all Builder graphs - set on every node in the graph
+        and used to guarantee uniqueness of nodes to the graph
     node_id_to_label : MutableMapping[str, str]
         label of node ID to its human-readable label - used for populating labels in the
         human-viewable output graph
+    constant_value_to_node : MutableMapping[tuple[type, str], Node]
+        mapping of a constant operand's type and string form to the node created for it - used to
+        reuse a single constant node for repeated int or float operands
+    plot_node_id_to_shape : MutableMapping[str, str]
+        mapping of the ID of every node and operation that is part of an operation, as well as of
+        any constant bound to an equality operation, to its shape in the output graph, in the
+        order they were added - used for drawing nodes in plot()
+    plot_edges : list[tuple[str, str]]
+        the (source ID, destination ID) edges between nodes and operations, added along with each
+        operation - used for drawing edges in plot()
+    graph_version : int
+        version of the graph that increments on addition of any new node or on filling node
+        values - used to tell whether a cached result is still valid
+    last_constraints_check : tuple[int, bool]
+        the graph_version at which constraints were last checked and whether they were
+        satisfied - used by plot() to avoid rerunning an unchanged graph
+    last_results : tuple[int, dict[str, int | float | bool] | None]
+        the graph_version of the last successful run of the graph and its results - used to
+        avoid rerunning an unchanged graph
+    last_plot : tuple[int, str, pydot.Dot | None]
+        the graph_version and layout quality of the last plot and the plot itself - used by plot()
+        to return the same plot while the graph is unchanged
 
     Methods
     -------
@@ -93,63 +221,95 @@ class Builder:
         Allows the user to call a custom function on the computational graph as an operation
     fill_nodes(self, inputs: MutableMapping[Node, int | float]) -> None
         Sets a mapping of the nodes to their input values
-    check_constraints(self) -> bool
+    fill_nodes_array(self, nodes: Sequence[Node], values: Sequence[int | float]) -> None
+        Sets the values of the nodes from two parallel sequences of nodes and values
+    reset_values(self) -> None
+        Clears all values set with fill_nodes() so the graph can be filled again
+    check_constraints(self, rerun: bool = False) -> bool
         Runs the graph and checks any assertions and the validity of the graph
-    get_graph_results(self) -> dict[str, int | float | bool] | None
+    get_graph_results(self, rerun: bool = False) -> dict[str, int | float | bool] | None
         Runs the graph and outputs the results of each node. Also internally validates the graph.
-    plot(self, filename: str | None = None) -> pydot.Dot
+    plot(self, filename: str | None = None, layout_quality: str = "best") -> pydot.Dot
         Runs the graph and renders the graph to the filename, if given
 
     """
 
     current_id: int
     current_operation_id: int
-    operations: list[Operation]
-    assertion_node_id_to_nodes: MutableMapping[str, list[Node | int | float]]
+    operations: list[tuple[str, tuple[str, ...], str, Callable]]
+    assertion_node_id_to_labels: MutableMapping[str, tuple[str, str]]
     inputs: MutableMapping[str, int | float | None]
-    nodes: set[Node]
+    filled_values: MutableMapping[str, int | float]
+    graph_id: int
     node_id_to_label: MutableMapping[str, str]
-
-    def __init__(self):
+    constant_value_to_node: MutableMapping[tuple[type, str], Node]
+    plot_node_id_to_shape: MutableMapping[str, str]
+    plot_edges: list[tuple[str, str]]
+    graph_version: int
+    last_constraints_check: tuple[int, bool]
+    last_results: tuple[int, dict[str, int | float | bool] | None]
+    last_plot: tuple[int, str, pydot.Dot | None]
+
+    def __init__(self) -> None:
         self.current_id = 0
         self.current_operation_id = 0
         self.operations = []
-        self.assertion_node_id_to_nodes = {}
+        self.assertion_node_id_to_labels = {}
         self.inputs = {}
-        self.nodes = set()
+        self.filled_values = {}
+        self.graph_id = next(_GRAPH_IDS)
         self.node_id_to_label = {}
-
-    def __equal__(self, a: int | float, b: int | float) -> bool:
-        # Checks equality of two numbers. The default tolerance is 1e-09 - https://docs.python.org/3/library/math.html#math.isclose.
-        return math.isclose(a, b)
+        self.constant_value_to_node = {}
+        self.plot_node_id_to_shape = {}
+        self.plot_edges = []
+        self.graph_version = 0
+        self.last_constraints_check = (-1, False)
+        self.last_results = (-1, None)
+        self.last_plot = (-1, "", None)
 
     def __check_operation__(
         self, nodes: Sequence[int | float | Node], op_name: str
     ) -> None:
-        # Validates that the given nodes for an operation are in the graph.
+        # Validates that the given nodes for an operation are in the graph. Membership is a
+        # graph ID compare, so no per-operand hashing is needed. The graph ID is read once
+        # for hints with many operands.
+        graph_id = self.graph_id
         for node in nodes:
-            if type(node) is Node and node not in self.nodes:
+            if type(node) is Node and node.graph_id != graph_id:
                 raise InvalidNodeArgument(
-                    f"Node {node.get_name()} isn't in graph. Unable to add the {op_name} operation."
+                    INVALID_OPERAND_MSG.format(name=node.get_name(), op_name=op_name)
                 )
 
     def __add_node__(self, name: str | None = None) -> Node:
-        # Adds a node to the current graph.
-        node = Node(str(self.current_id), name=name)
+        # Adds a node to the current graph. Names are interned, since the same few names are
+        # often repeated across graphs and end up as dict values and in output messages.
+        if name != None:
+            name = sys.intern(name)
+
+        # The node is created with positional arguments, which halves the cost of the
+        # constructor call compared to keyword arguments.
+        node = Node(str(self.current_id), name, self.graph_id)
         self.current_id += 1
         self.node_id_to_label[node.id] = node.get_name()
-        self.nodes.add(node)
+        self.graph_version += 1
         return node
 
     def __maybe_add_constant_nodes__(
         self, nodes: Sequence[int | float | Node]
     ) -> Sequence[Node]:
-        # Converts any int or constant values in the list of nodes to Constant nodes.
+        # Converts any int or constant values in the list of nodes to Constant nodes. Repeated
+        # values reuse the same node. The key is the type and string form of the value, so that
+        # 1 and 1.0 as well as 0.0 and -0.0 stay distinct, even though they compare equal.
         nodes_with_constants = []
 
         for maybe_constant in nodes:
             if type(maybe_constant) in (int, float):
-                constant_node = self.constant(maybe_constant, name=str(maybe_constant))  # type: ignore[arg-type]
+                name = str(maybe_constant)
+                key = (type(maybe_constant), name)
+                constant_node = self.constant_value_to_node.get(key)
+                if constant_node is None:
+                    constant_node = self.constant(maybe_constant, name=name)  # type: ignore[arg-type]
+                    self.constant_value_to_node[key] = constant_node
                 nodes_with_constants.append(constant_node)
             else:
                 nodes_with_constants.append(maybe_constant)  # type: ignore[arg-type]
@@ -163,83 +323,137 @@ class Builder:
         fn: Callable,
         op_id: str,
         op_name: str | None = None,
-    ) -> None:
-        # Adds an operation to the current graph.
+    ) -> Sequence[Node]:
+        # Adds an operation to the current graph. Returns the operand nodes of the operation.
         op_name = op_name if op_name else op_id
         nodes = self.__maybe_add_constant_nodes__(operands)
-        node_ids = [node.id for node in nodes]
+        node_ids = tuple(node.id for node in nodes)
 
-        self.operations.append(
-            operation(name=op_id, needs=node_ids, provides=[result_node.id])(fn)
-        )
+        self.operations.append((op_id, node_ids, result_node.id, fn))
         self.current_operation_id += 1
 
+        # Record the nodes and edges this operation adds to the output graph. An operand that
+        # is used more than once, e.g. in mul(x, x), only gets a single edge.
+        operand_ids = dict.fromkeys(node_ids)
+        for node_id in operand_ids:
+            self.plot_node_id_to_shape.setdefault(node_id, "rect")
+        self.plot_node_id_to_shape[op_id] = "circle"
+        self.plot_node_id_to_shape[result_node.id] = "rect"
+        self.plot_edges.extend((node_id, op_id) for node_id in operand_ids)
+        self.plot_edges.append((op_id, result_node.id))
+
         # Operations are also nodes in the graph.
         self.node_id_to_label[op_id] = op_name
-
-    def __get_graph__(self) -> compose | None:
-        # Validates the graph. If valid, returns the graph composition. Otherwise, returns None.
+        return nodes
+
+    def __get_label__(self, node_id: str) -> str:
+        # Returns the human-readable label of a node or operation. The label of a node whose
+        # value was set with fill_nodes() also shows that value.
+        label = self.node_id_to_label.get(node_id, node_id)
+        if node_id in self.filled_values:
+            return f"{label} = {self.filled_values[node_id]}"
+        return label
+
+    def __validate_graph__(self) -> bool:
+        # Validates that the graph has operations and that all of its input nodes are defined.
         if len(self.operations) == 0:
-            print(
-                f"No operations in graph. Cannot run graph without any operations defined.",
-                file=sys.stderr,
-            )
-            return None
+            logger.error(NO_OPERATIONS_MSG, extra={"code": ErrorCode.NO_OPERATIONS})
+            return False
 
+        # A filled value takes the place of the input's value, and may itself be None.
+        filled_values = self.filled_values
         for node_id, val in self.inputs.items():
-            if val == None:
-                print(
-                    f"Node {self.node_id_to_label[node_id]} is undefined. Must define node in order to check constraints.",
-                    file=sys.stderr,
+            if filled_values.get(node_id, val) == None:
+                logger.error(
+                    UNDEFINED_NODE_MSG.format(label=self.__get_label__(node_id)),
+                    extra={"code": ErrorCode.UNDEFINED_NODE},
                 )
-                return None
+                return False
 
-        return compose(name="graph")(*self.operations)
+        return True
 
     def __run_graph__(
-        self, graph_composer: compose | None = None
+        self, rerun: bool = False
     ) -> dict[str, int | float | bool] | None:
         # Runs the graph and returns the output. May return None if the graph isn't valid.
-        graph = graph_composer
+        #
+        # Every operation is added after its operand nodes exist and creates a new result node,
+        # so the operations list is already in topological order and can be run front to back.
+        #
+        # The results of the last successful run are returned as is if the graph hasn't changed
+        # since, unless a rerun is requested, so callers must not modify them.
+        results_version, results = self.last_results
+        if not rerun and results != None and results_version == self.graph_version:
+            return results
+
+        if not self.__validate_graph__():
+            return None
 
-        if graph == None:
-            graph = self.__get_graph__()
+        # Validation guarantees that none of the inputs are undefined.
+        computation_result: dict[str, int | float | bool] = {**self.inputs, **self.filled_values}  # type: ignore[dict-item]
+
+        # Add, mul, and equality operations between two nodes have two operands, and equality
+        # operations against a bound constant have one, so their values are looked up directly
+        # and passed positionally. The operands of any other operation are gathered with map()
+        # over the stored operand IDs.
+        get_value = computation_result.__getitem__
+        for _, needs, provides, fn in self.operations:
+            if len(needs) == 2:
+                a, b = needs
+                computation_result[provides] = fn(
+                    computation_result[a], computation_result[b]
+                )
+            elif len(needs) == 1:
+                computation_result[provides] = fn(computation_result[needs[0]])
+            else:
+                computation_result[provides] = fn(*map(get_value, needs))
 
-        return None if graph == None else graph(self.inputs)
+        self.last_results = (self.graph_version, computation_result)
+        return computation_result
 
-    def __check_constraints__(self, graph_composer: compose | None = None) -> bool:
-        # Validates the graph, runs it, and then checks all assertions and expected values.
-        computation_result = self.__run_graph__(graph_composer)
+    def __check_constraints__(self, rerun: bool = False) -> bool:
+        # Validates the graph, runs it, and then checks all assertions and expected values. The
+        # outcome is recorded against the current graph version.
+        computation_result = self.__run_graph__(rerun)
 
         if computation_result == None:
+            self.last_constraints_check = (self.graph_version, False)
             return False
 
-        satisfied_constraints = True
+        # Collect the failures in a single pass over each mapping, and only build the
+        # human-readable output for the nodes that failed.
+        failed_expectations = [
+            node_id
+            for node_id, val in self.filled_values.items()
+            if val != computation_result[node_id]
+        ]
+        failed_assertions = [
+            node_id
+            for node_id in self.assertion_node_id_to_labels
+            if not computation_result[node_id]
+        ]
+
+        for node_id in failed_expectations:
+            logger.warning(
+                FAILED_EXPECTATION_MSG.format(
+                    label=self.__get_label__(node_id),
+                    expected=self.filled_values[node_id],
+                    calculated=computation_result[node_id],
+                ),
+                extra={"code": ErrorCode.FAILED_EXPECTATION},
+            )
 
-        for node_id, val in self.inputs.items():
-            if val != computation_result[node_id]:
-                print(
-                    f"Node {self.node_id_to_label[node_id]} has an expected value of {val}, but this does not match the calculated value of {computation_result[node_id]}"
-                )
-                satisfied_constraints = False
-
-        for node_id, operands in self.assertion_node_id_to_nodes.items():
-            if not computation_result[node_id]:
-                a_label = (
-                    operands[0].get_name()
-                    if type(operands[0]) is Node
-                    else str(operands[0])
-                )
-                b_label = (
-                    operands[1].get_name()
-                    if type(operands[1]) is Node
-                    else str(operands[1])
-                )
-                print(
-                    f"Node {self.node_id_to_label[node_id]} has failed assertion that node {a_label} and node {b_label} are equal."
-                )
-                satisfied_constraints = False
+        for node_id in failed_assertions:
+            a_label, b_label = self.assertion_node_id_to_labels[node_id]
+            logger.warning(
+                FAILED_ASSERTION_MSG.format(
+                    label=self.__get_label__(node_id), a_label=a_label, b_label=b_label
+                ),
+                extra={"code": ErrorCode.FAILED_ASSERTION},
+            )
 
+        satisfied_constraints = not failed_expectations and not failed_assertions
+        self.last_constraints_check = (self.graph_version, satisfied_constraints)
         return satisfied_constraints
 
     def init(self, name: str | None = None) -> Node:
@@ -364,12 +578,13 @@ class Builder:
         b: int | float | Node,
         name: str | None = None,
         op_name: str | None = None,
-    ):
+    ) -> Node:
         """Returns a new node in the graph for asserting equality
 
-        Defines an equality operation on the given two nodes or constants. If the given
-        a and b operands are constants, they will be converted to nodes with constant values and added
-        to the graph.
+        Defines an equality operation on the given two nodes or constants. If one of the operands
+        is a constant and the other is a node, the constant is bound to the equality operation
+        rather than added to the graph. If both operands are constants, they will be converted to
+        nodes with constant values and added to the graph.
 
         Parameters
         ----------
@@ -394,9 +609,38 @@ class Builder:
         self.__check_operation__(operands, op_name if op_name else "equal")
 
         result_node = self.__add_node__(name=name)
-        self.assertion_node_id_to_nodes[result_node.id] = operands
         op_id = "equal" + str(self.current_operation_id)
-        self.__add_operation__(operands, result_node, self.__equal__, op_id, op_name)
+        # Comparing a node against a constant only needs the node as an operand, so the constant
+        # is bound to the equality function instead of getting its own node. It's still drawn
+        # as an input of the operation in the plot, reusing the constant's node if it has one.
+        a_is_constant = type(a) in (int, float)
+        b_is_constant = type(b) in (int, float)
+        if a_is_constant != b_is_constant:
+            constant, node = (a, b) if a_is_constant else (b, a)
+            self.__add_operation__(
+                [node], result_node, partial(_equal, constant), op_id, op_name  # type: ignore[arg-type]
+            )
+
+            constant_name = str(constant)
+            constant_node = self.constant_value_to_node.get(
+                (type(constant), constant_name)
+            )
+            if constant_node != None:
+                constant_id = constant_node.id
+            else:
+                constant_id = "constant" + constant_name
+                self.node_id_to_label[constant_id] = constant_name
+            self.plot_node_id_to_shape.setdefault(constant_id, "rect")
+            self.plot_edges.append((constant_id, op_id))
+        else:
+            self.__add_operation__(operands, result_node, _equal, op_id, op_name)
+
+        self.assertion_node_id_to_labels[result_node.id] = (
+            a.get_name() if isinstance(a, Node) else str(a),
+            b.get_name() if isinstance(b, Node) else str(b),
+        )
+
+        return result_node
 
     def hint(
         self,
@@ -411,6 +655,11 @@ class Builder:
         nodes. Any node in the list of nodes that is a constant will be converted to a node
         with a constant value in the graph.
 
+        The function is only called when the graph is run. The graph isn't run again until
+        nodes are added or filled, so a function that depends on state outside the graph or
+        has side effects should be rerun explicitly with check_constraints(rerun=True) or
+        get_graph_results(rerun=True).
+
         Parameters
         ----------
         fn : Callable
@@ -445,54 +694,157 @@ class Builder:
         a value mapping on any node in the graph, and it will be checked in
         check_constraints().
 
-        Outputs any nodes not found in the graph to stderr.
+        Logs an error for any nodes not found in the graph.
 
         Parameters
         ----------
         inputs : MutableMapping[Node, int | float]
             The map of nodes to values
         """
-        for node, val in inputs.items():
-            if node not in self.nodes:
-                print(
-                    f"Node {node.get_name()} isn't in graph. Cannot set its value.",
-                    file=sys.stderr,
+        self.fill_nodes_array(tuple(inputs), tuple(inputs.values()))
+
+    def fill_nodes_array(
+        self, nodes: Sequence[Node], values: Sequence[int | float]
+    ) -> None:
+        """Set the values of any nodes in the graph from parallel sequences
+
+        Same as fill_nodes(), but takes the nodes and their values as two sequences of the
+        same length, where each node is set to the value at the same index. Any sequence
+        type works for the values, including a numpy array, and all values are set in a
+        single batch.
+
+        Logs an error for any nodes not found in the graph.
+
+        Parameters
+        ----------
+        nodes : Sequence[Node]
+            The nodes to set the values of
+        values : Sequence[int | float]
+            The values of the nodes, in the same order as the nodes
+
+        Raises
+        ------
+        MismatchedFillValues
+            If the number of nodes and values differ.
+        """
+        if len(nodes) != len(values):
+            raise MismatchedFillValues(
+                MISMATCHED_FILL_VALUES_MSG.format(
+                    values_count=len(values), nodes_count=len(nodes)
                 )
-            self.inputs[node.id] = val
-            self.node_id_to_label[node.id] = (
-                self.node_id_to_label[node.id] + " = " + str(val)
             )
 
-    def check_constraints(self) -> bool:
+        graph_id = self.graph_id
+        for node in nodes:
+            if node.graph_id != graph_id:
+                logger.error(
+                    NODE_NOT_IN_GRAPH_MSG.format(name=node.get_name()),
+                    extra={"code": ErrorCode.NODE_NOT_IN_GRAPH},
+                )
+        self.filled_values.update(zip(map(attrgetter("id"), nodes), values))
+        self.graph_version += 1
+
+    def reset_values(self) -> None:
+        """Clear the values of all nodes in the graph
+
+        Removes every value set with fill_nodes(), leaving the nodes and operations of the
+        graph unchanged. Allows a single graph to be reused with different inputs.
+        """
+        self.filled_values.clear()
+        self.graph_version += 1
+
+    def check_constraints(self, rerun: bool = False) -> bool:
         """Checks all assertions and any value expectations in the input map
 
         Explicitly checks all assertions defined on the graph with assert_equal(). Also checks
-        any value expectations in the input map if defined in fill_nodes(). Prints out any nodes
-        that don't match the expected value or any failed assertions to stdout.
+        any value expectations in the input map if defined in fill_nodes(). Logs a warning for
+        any nodes that don't match the expected value and for any failed assertions.
+
+        The graph is only run if nodes were added or filled since its last successful run.
+        Otherwise the results of that run are checked again, including the values returned by
+        any hints. Pass rerun=True to run the graph regardless, e.g. if a hint depends on
+        state outside the graph.
+
+        Parameters
+        ----------
+        rerun : bool, optional
+            Whether to run the graph even if it hasn't changed since its last successful run
 
         Returns
         -------
             A boolean representing whether or not all constraints were met.
         """
-        return self.__check_constraints__()
+        return self.__check_constraints__(rerun)
 
-    def get_graph_results(self) -> dict[str, int | float | bool] | None:
+    def get_graph_results(
+        self, rerun: bool = False
+    ) -> dict[str, int | float | bool] | None:
         """Outputs the results of running the graph
 
         Convenience function that returns the values of all nodes in the graph, including any
         computed intermediate node values. The output is a map of Node ID to value. Using
         the node ID is necessary to guarantee uniqueness of nodes within the graph.
 
+        The graph is only run if nodes were added or filled since its last successful run.
+        Otherwise a copy of the results of that run is returned, including the values returned
+        by any hints. Pass rerun=True to run the graph regardless, e.g. if a hint depends on
+        state outside the graph.
+
+        Parameters
+        ----------
+        rerun : bool, optional
+            Whether to run the graph even if it hasn't changed since its last successful run
+
         Returns
         -------
             A dict of node ID to their value in the graph.
         """
-        return self.__run_graph__()
+        computation_result = self.__run_graph__(rerun)
+        if computation_result == None:
+            return None
+        return dict(computation_result)
 
-    def plot(self, filename: str | None = None) -> pydot.Dot:
+    def __render_dot__(
+        self,
+        nodes: Sequence[tuple[str, str, str]],
+        edges: Sequence[tuple[str, str]],
+        graph_attributes: MutableMapping[str, str],
+        output_format: str | None = None,
+    ) -> bytes:
+        # Writes the DOT source for the given graph attributes, (name, label, shape) nodes and
+        # (source, destination) edges. If an output format is given, the source is piped
+        # straight to the Graphviz dot program and its output is returned instead, which avoids
+        # pydot's serializer and the temporary files it writes.
+        def quote(value: str) -> str:
+            return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+        lines = ["digraph G {\n"]
+        if graph_attributes:
+            attributes = ", ".join(f"{k}={v}" for k, v in graph_attributes.items())
+            lines.append(f"graph [{attributes}];\n")
+        for name, label, shape in nodes:
+            lines.append(f"{quote(name)} [label={quote(label)}, shape={shape}];\n")
+        for src, dst in edges:
+            lines.append(f"{quote(src)} -> {quote(dst)};\n")
+        lines.append("}\n")
+        dot_source = "".join(lines).encode()
+
+        if output_format == None:
+            return dot_source
+
+        return subprocess.run(
+            ["dot", "-T" + output_format],
+            input=dot_source,
+            stdout=subprocess.PIPE,
+            check=True,
+        ).stdout
+
+    def plot(
+        self, filename: str | None = None, layout_quality: str = "best"
+    ) -> pydot.Dot:
         """Plot the graph and write it out to the given file name.
 
-        Copied from https://github.com/yahoo/graphkit/blob/master/graphkit/network.py
+        Adapted from https://github.com/yahoo/graphkit/blob/master/graphkit/network.py
         and updated for Python 3.10+
 
         Parameters
@@ -500,69 +852,96 @@ class Builder:
         filename:
             Write the output to a png, pdf, or graphviz dot file. The extension
             controls the output format.
+        layout_quality:
+            Either "best" for Graphviz's default layout or "fast" to limit the layout
+            iterations and draw straight edges, which is much faster for large graphs.
 
         Returns
         -------
-            An instance of the pydot graph.
+            An instance of the pydot graph. The same instance is returned until the graph
+            changes, unless a filename is given.
 
         Raises
         ------
         UnsupportedPlotFileExtension
             If the specified file extension isn't supported.
+        UnsupportedLayoutQuality
+            If the specified layout quality isn't supported.
 
         """
-        g = pydot.Dot(graph_type="digraph")
-
-        graph_composer = self.__get_graph__()
-        if not self.__check_constraints__(graph_composer):
+        if layout_quality not in _LAYOUT_QUALITY_TO_GRAPH_ATTRIBUTES:
+            raise UnsupportedLayoutQuality(
+                UNSUPPORTED_LAYOUT_QUALITY_MSG.format(layout_quality=layout_quality)
+            )
+        graph_attributes = _LAYOUT_QUALITY_TO_GRAPH_ATTRIBUTES[layout_quality]
+
+        # Return the last plot if the graph hasn't changed since and there's nothing to write out.
+        plotted_version, plotted_layout_quality, last_plot = self.last_plot
+        if (
+            filename == None
+            and last_plot != None
+            and plotted_version == self.graph_version
+            and plotted_layout_quality == layout_quality
+        ):
+            return last_plot
+
+        g = pydot.Dot(graph_type="digraph", **graph_attributes)
+
+        # Reuse the outcome of the last constraint check if nothing has changed since, e.g.
+        # when plotting right after calling check_constraints().
+        checked_version, satisfied_constraints = self.last_constraints_check
+        if checked_version != self.graph_version:
+            satisfied_constraints = self.__check_constraints__()
+        if not satisfied_constraints:
+            self.last_plot = (self.graph_version, layout_quality, g)
             return g
-        graph = graph_composer.net.graph
 
-        def get_node_name(a):
-            if isinstance(a, DataPlaceholderNode):
-                return a
-            return a.name
+        # Resolve every label up front, so that each node only needs a single lookup.
+        labels = dict(self.node_id_to_label)
+        labels.update(
+            (node_id, self.__get_label__(node_id)) for node_id in self.filled_values
+        )
 
         # Draw nodes
-        for nx_node in graph.nodes():
-            name = get_node_name(nx_node)
-            label = name
-
-            if self.node_id_to_label and name in self.node_id_to_label:
-                label = self.node_id_to_label[name]
-            if isinstance(nx_node, DataPlaceholderNode):
-                node = pydot.Node(name=nx_node, label=label, shape="rect")
-            else:
-                node = pydot.Node(name=name, label=label, shape="circle")
-            g.add_node(node)
+        nodes = [
+            (node_id, labels.get(node_id, node_id), shape)
+            for node_id, shape in self.plot_node_id_to_shape.items()
+        ]
+        for name, label, shape in nodes:
+            g.add_node(pydot.Node(name=name, label=label, shape=shape))
 
         # Draw edges
-        for src, dst in graph.edges():
-            src_name = get_node_name(src)
-            dst_name = get_node_name(dst)
-            edge = pydot.Edge(src=src_name, dst=dst_name)
-            g.add_edge(edge)
+        edges = self.plot_edges
+        for src_name, dst_name in edges:
+            g.add_edge(pydot.Edge(src=src_name, dst=dst_name))
+
+        self.last_plot = (self.graph_version, layout_quality, g)
 
         # Save plot
         if filename:
             basename, ext = os.path.splitext(filename)
 
-            ext_to_img_create_fn = {
-                ".png": g.create_png,
-                ".jpg": g.create_jpeg,
-                ".jpeg": g.create_jpeg,
-                ".svg": g.create_svg,
-                ".pdf": g.create_pdf,
-                ".dot": g.to_string,
+            ext_to_format = {
+                ".png": "png",
+                ".jpg": "jpeg",
+                ".jpeg": "jpeg",
+                ".svg": "svg",
+                ".pdf": "pdf",
+                ".dot": None,
             }
 
             ext_lowered = ext.lower()
-            if ext_lowered not in ext_to_img_create_fn:
+            if ext_lowered not in ext_to_format:
                 raise UnsupportedPlotFileExtension(
-                    f"Unknown file format for saving graph: {ext}"
+                    UNSUPPORTED_PLOT_FILE_EXTENSION_MSG.format(ext=ext)
                 )
 
+            # Render before opening the file, so that a missing or failing dot program
+            # doesn't truncate an existing file.
+            rendered = self.__render_dot__(
+                nodes, edges, graph_attributes, ext_to_format[ext_lowered]
+            )
             with open(filename, "wb") as f:
-                f.write(ext_to_img_create_fn[ext_lowered]())
+                f.write(rendered)
 
         return g
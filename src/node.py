@@ -17,6 +17,9 @@ class Node:
     name : str
         the human-readable and customizable name of the node - used to label the node
         in a generated graph
+    graph_id : int | None
+        the ID of the Builder graph the node belongs to - used by the Builder to check that
+        a node is in its graph
 
     Methods
     -------
@@ -25,9 +28,17 @@ class Node:
         ID of the node.
     """
 
-    def __init__(self, id: str, name: str | None = None) -> None:
+    # Nodes are created for every value, constant, and operation result in a graph, so
+    # avoid a per-instance __dict__. Equality and hashing are left as identity since node
+    # IDs are only unique within a single Builder graph.
+    __slots__ = ("id", "name", "graph_id")
+
+    def __init__(
+        self, id: str, name: str | None = None, graph_id: int | None = None
+    ) -> None:
         self.id = id
         self.name = name
+        self.graph_id = graph_id
 
     def get_name(self) -> str:
         return self.name if self.name else self.id
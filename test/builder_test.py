@@ -1,48 +1,101 @@
-from src.builder import Builder, InvalidNodeArgument, UnsupportedPlotFileExtension
-
-import contextlib
-import io
-import math
+from src.builder import (
+    FAILED_ASSERTION_MSG,
+    FAILED_EXPECTATION_MSG,
+    INVALID_OPERAND_MSG,
+    MISMATCHED_FILL_VALUES_MSG,
+    NO_OPERATIONS_MSG,
+    NODE_NOT_IN_GRAPH_MSG,
+    UNDEFINED_NODE_MSG,
+    UNSUPPORTED_LAYOUT_QUALITY_MSG,
+    UNSUPPORTED_PLOT_FILE_EXTENSION_MSG,
+    Builder,
+    ErrorCode,
+    InvalidNodeArgument,
+    MismatchedFillValues,
+    UnsupportedLayoutQuality,
+    UnsupportedPlotFileExtension,
+    logger,
+)
+
+import logging
+import os
+import pytest
+import subprocess
+import tempfile
 import unittest
+from unittest import mock
+
+
+class ListHandler(logging.Handler):
+    """Collects the messages logged by the builder"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages: list[str] = []
+        self.codes: list[ErrorCode] = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+        self.codes.append(record.code)
+
+    def clear(self):
+        self.messages.clear()
+        self.codes.clear()
+
+
+class LogCapturingTestCase(unittest.TestCase):
+    """Collects the builder's log output for each test in handler"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.handler = ListHandler()
+        logger.addHandler(cls.handler)
 
-class TestBuilder(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        logger.removeHandler(cls.handler)
 
+    def setUp(self):
+        self.handler.clear()
+
+
+class TestBuilder(LogCapturingTestCase):
+
+    @pytest.mark.coverage
     def test_empty_graph(self):
         builder = Builder()
-        f = io.StringIO()
-        with contextlib.redirect_stderr(f):
-            self.assertFalse(builder.check_constraints())
-            self.assertEqual(
-                "No operations in graph. Cannot run graph without any operations defined.",
-                f.getvalue().rstrip(),
-            )
-            self.assertIsNone(builder.get_graph_results())
+        self.assertFalse(builder.check_constraints())
+        self.assertEqual(
+            [NO_OPERATIONS_MSG],
+            self.handler.messages,
+        )
+        self.assertEqual([ErrorCode.NO_OPERATIONS], self.handler.codes)
+        self.assertIsNone(builder.get_graph_results())
 
-            plot = builder.plot()
+        plot = builder.plot()
 
-            self.assertEqual(len(plot.get_nodes()), 0)
-            self.assertEqual(len(plot.get_edges()), 0)
+        self.assertEqual(len(plot.get_nodes()), 0)
+        self.assertEqual(len(plot.get_edges()), 0)
 
     def test_no_operations(self):
         builder = Builder()
         x = builder.init()
         builder.fill_nodes({x: 1})
 
-        f = io.StringIO()
-        with contextlib.redirect_stderr(f):
-            self.assertFalse(builder.check_constraints())
-            self.assertEqual(
-                "No operations in graph. Cannot run graph without any operations defined.",
-                f.getvalue().rstrip(),
-            )
-            self.assertIsNone(builder.get_graph_results())
+        self.assertFalse(builder.check_constraints())
+        self.assertEqual(
+            [NO_OPERATIONS_MSG],
+            self.handler.messages,
+        )
+        self.assertEqual([ErrorCode.NO_OPERATIONS], self.handler.codes)
+        self.assertIsNone(builder.get_graph_results())
 
-            plot = builder.plot()
+        plot = builder.plot()
 
-            self.assertEqual(len(plot.get_nodes()), 0)
-            self.assertEqual(len(plot.get_edges()), 0)
+        self.assertEqual(len(plot.get_nodes()), 0)
+        self.assertEqual(len(plot.get_edges()), 0)
 
+    @pytest.mark.coverage
     def test_undefined_node(self):
         builder = Builder()
         x = builder.init(name="x")
@@ -50,13 +103,25 @@ class TestBuilder(unittest.TestCase):
         x_plus_one = builder.add(x, one)
         builder.fill_nodes({})
 
-        f = io.StringIO()
-        with contextlib.redirect_stderr(f):
-            self.assertFalse(builder.check_constraints())
-            self.assertEqual(
-                "Node x is undefined. Must define node in order to check constraints.",
-                f.getvalue().rstrip(),
-            )
+        self.assertFalse(builder.check_constraints())
+        self.assertEqual(
+            [UNDEFINED_NODE_MSG.format(label="x")],
+            self.handler.messages,
+        )
+        self.assertEqual([ErrorCode.UNDEFINED_NODE], self.handler.codes)
+
+    @pytest.mark.coverage
+    def test_node_filled_with_none(self):
+        builder = Builder()
+        x = builder.init(name="x")
+        x_plus_one = builder.add(x, 1)
+        builder.fill_nodes({x: None})
+
+        self.assertFalse(builder.check_constraints())
+        self.assertEqual(
+            [UNDEFINED_NODE_MSG.format(label="x = None")], self.handler.messages
+        )
+        self.assertEqual([ErrorCode.UNDEFINED_NODE], self.handler.codes)
 
     def test_failed_constraint(self):
         builder = Builder()
@@ -65,14 +130,37 @@ class TestBuilder(unittest.TestCase):
         x_plus_one = builder.add(x, one, name="x + 1")
         builder.fill_nodes({x: 1, x_plus_one: 3})
 
-        f = io.StringIO()
-        with contextlib.redirect_stdout(f):
-            self.assertFalse(builder.check_constraints())
-            self.assertEqual(
-                "Node x + 1 = 3 has an expected value of 3, but this does not match the calculated value of 2",
-                f.getvalue().rstrip(),
-            )
+        self.assertFalse(builder.check_constraints())
+        self.assertEqual(
+            [
+                FAILED_EXPECTATION_MSG.format(
+                    label="x + 1 = 3", expected=3, calculated=2
+                )
+            ],
+            self.handler.messages,
+        )
+        self.assertEqual([ErrorCode.FAILED_EXPECTATION], self.handler.codes)
+
+    def test_failed_constraint_after_refilling_node(self):
+        builder = Builder()
+        x = builder.init(name="x")
+        x_plus_one = builder.add(x, 1, name="x + 1")
+        builder.fill_nodes({x: 1, x_plus_one: 2})
+        self.assertTrue(builder.check_constraints())
+        builder.fill_nodes({x_plus_one: 4})
+
+        self.assertFalse(builder.check_constraints())
+        self.assertEqual(
+            [
+                FAILED_EXPECTATION_MSG.format(
+                    label="x + 1 = 4", expected=4, calculated=2
+                )
+            ],
+            self.handler.messages,
+        )
+        self.assertEqual([ErrorCode.FAILED_EXPECTATION], self.handler.codes)
 
+    @pytest.mark.coverage
     def test_failed_assertion(self):
         builder = Builder()
         x = builder.init(name="x")
@@ -81,14 +169,18 @@ class TestBuilder(unittest.TestCase):
         builder.assert_equal(x_plus_one, 3, "assert 1 + 1 = 3")
         builder.fill_nodes({x: 1})
 
-        f = io.StringIO()
-        with contextlib.redirect_stdout(f):
-            self.assertFalse(builder.check_constraints())
-            self.assertEqual(
-                "Node assert 1 + 1 = 3 has failed assertion that node x + 1 and node 3 are equal.",
-                f.getvalue().rstrip(),
-            )
+        self.assertFalse(builder.check_constraints())
+        self.assertEqual(
+            [
+                FAILED_ASSERTION_MSG.format(
+                    label="assert 1 + 1 = 3", a_label="x + 1", b_label="3"
+                )
+            ],
+            self.handler.messages,
+        )
+        self.assertEqual([ErrorCode.FAILED_ASSERTION], self.handler.codes)
 
+    @pytest.mark.coverage
     def test_filling_value_on_node_not_in_graph(self):
         builder_a = Builder()
         x = builder_a.init(name="x")
@@ -98,12 +190,41 @@ class TestBuilder(unittest.TestCase):
         builder_b = Builder()
         y = builder_b.init(name="y")
 
-        f = io.StringIO()
-        with contextlib.redirect_stderr(f):
-            self.assertFalse(builder_a.fill_nodes({x: 1, y: 2}))
-            self.assertEqual(
-                "Node y isn't in graph. Cannot set its value.", f.getvalue().rstrip()
-            )
+        self.assertFalse(builder_a.fill_nodes({x: 1, y: 2}))
+        self.assertEqual(
+            [NODE_NOT_IN_GRAPH_MSG.format(name="y")], self.handler.messages
+        )
+        self.assertEqual([ErrorCode.NODE_NOT_IN_GRAPH], self.handler.codes)
+
+    @pytest.mark.coverage
+    def test_fill_nodes_array(self):
+        builder_a = Builder()
+        x = builder_a.init(name="x")
+        y = builder_a.init(name="y")
+        x_plus_y = builder_a.add(x, y, name="x + y")
+
+        builder_b = Builder()
+        z = builder_b.init(name="z")
+
+        builder_a.fill_nodes_array([x, y, x_plus_y], (1, 2, 3))
+        self.assertTrue(builder_a.check_constraints())
+        self.assertEqual(builder_a.get_graph_results()[x_plus_y.id], 3)
+
+        with self.assertRaises(MismatchedFillValues) as error:
+            builder_a.fill_nodes_array([x, y], [5])
+
+        self.assertEqual(
+            MISMATCHED_FILL_VALUES_MSG.format(values_count=1, nodes_count=2),
+            str(error.exception),
+        )
+        self.assertEqual(ErrorCode.MISMATCHED_FILL_VALUES, error.exception.code)
+        self.assertEqual(builder_a.get_graph_results()[x.id], 1)
+
+        builder_a.fill_nodes_array([z], [4])
+        self.assertEqual(
+            [NODE_NOT_IN_GRAPH_MSG.format(name="z")], self.handler.messages
+        )
+        self.assertEqual([ErrorCode.NODE_NOT_IN_GRAPH], self.handler.codes)
 
     def test_error_when_mixing_nodes_between_different_graphs(self):
         builder_a = Builder()
@@ -118,78 +239,64 @@ class TestBuilder(unittest.TestCase):
             x_plus_two = builder_b.add(x, two, op_name="x + 2")
 
         self.assertEqual(
-            "Node x isn't in graph. Unable to add the x + 2 operation.",
+            INVALID_OPERAND_MSG.format(name="x", op_name="x + 2"),
             str(error.exception),
         )
+        self.assertEqual(ErrorCode.OPERAND_NOT_IN_GRAPH, error.exception.code)
 
-    def test_unsupported_file_extension_exception(self):
+    @pytest.mark.coverage
+    def test_plot_to_dot_file(self):
         builder = Builder()
-        x = builder.init()
-        one = builder.constant(1)
-        x_plus_one = builder.add(x, one)
+        x = builder.init(name="x")
+        x_plus_one = builder.add(x, 1, name='"x" + 1')
         builder.fill_nodes({x: 1})
 
-        with self.assertRaises(UnsupportedPlotFileExtension) as error:
-            builder.plot(filename="my_chart.foo")
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "x_plus_one.dot")
+            builder.plot(filename=filename)
 
-        self.assertEqual(
-            "Unknown file format for saving graph: .foo", str(error.exception)
-        )
+            with open(filename) as f:
+                dot_source = f.read()
 
-    def test_simple_graph(self):
-        builder = Builder()
-        x = builder.init()
-        one = builder.constant(1)
-        x_plus_one = builder.add(x, one)
-        builder.fill_nodes({x: 1})
-        self.assertTrue(builder.check_constraints())
-        self.assertEqual(builder.get_graph_results()[x.id], 1)
-        self.assertEqual(builder.get_graph_results()[x_plus_one.id], 2)
+        self.assertTrue(dot_source.startswith("digraph G {"))
+        self.assertIn('"0" [label="x = 1", shape=rect];', dot_source)
+        self.assertIn('"1" [label="\\"x\\" + 1", shape=rect];', dot_source)
+        self.assertIn('"add0" [label="add0", shape=circle];', dot_source)
+        self.assertIn('"0" -> "add0";', dot_source)
+        self.assertIn('"add0" -> "1";', dot_source)
 
-        plot = builder.plot()
+    def test_graph_results_are_reused_until_graph_changes(self):
+        calls = []
 
-        self.assertEqual(len(plot.get_nodes()), 4)
-        self.assertEqual(len(plot.get_edges()), 3)
+        def identity(a):
+            calls.append(a)
+            return a
 
-    def test_node_mul_node_with_automatic_constant_node_creation(self):
         builder = Builder()
         x = builder.init()
-        x_squared = builder.mul(x, x)
-        x_squared_plus_five = builder.add(x_squared, 5)
-        y = builder.add(x_squared_plus_five, x)
-        builder.fill_nodes({x: 2, y: 11})
+        y = builder.hint(identity, [x])
+        builder.fill_nodes({x: 1})
         self.assertTrue(builder.check_constraints())
-        self.assertEqual(builder.get_graph_results()[x.id], 2)
-        self.assertEqual(builder.get_graph_results()[y.id], 11)
 
-        plot = builder.plot()
+        results = builder.get_graph_results()
+        results[y.id] = 2
 
-        self.assertEqual(len(plot.get_nodes()), 8)
-        self.assertEqual(len(plot.get_edges()), 8)
+        self.assertEqual(builder.get_graph_results()[y.id], 1)
+        self.assertEqual(len(calls), 1)
 
-    def test_node_with_hint(self):
-        def divide_by_eight(a):
-            return a / 8
+        builder.fill_nodes({x: 3})
 
-        builder = Builder()
-        a = builder.init()
-        b = builder.add(a, 1)
-        c = builder.hint(divide_by_eight, [b])
-        c_times_8 = builder.mul(c, 8)
-        builder.assert_equal(b, c_times_8)
-
-        builder.fill_nodes({a: 2})
-        self.assertTrue(builder.check_constraints())
-        self.assertEqual(builder.get_graph_results()[a.id], 2)
-        self.assertEqual(builder.get_graph_results()[c.id], 0.375)
-        self.assertEqual(builder.get_graph_results()[c_times_8.id], 3)
-
-        plot = builder.plot()
+        self.assertEqual(builder.get_graph_results()[y.id], 3)
+        self.assertEqual(len(calls), 2)
 
-        self.assertEqual(len(plot.get_nodes()), 11)
-        self.assertEqual(len(plot.get_edges()), 11)
+        self.assertEqual(builder.get_graph_results(rerun=True)[y.id], 3)
+        self.assertEqual(len(calls), 3)
+        self.assertTrue(builder.check_constraints(rerun=True))
+        self.assertEqual(len(calls), 4)
 
     def test_node_with_irrational_hint_computation(self):
+        import math
+
         def my_sqrt(a):
             return math.sqrt(a)
 
@@ -211,6 +318,7 @@ class TestBuilder(unittest.TestCase):
         self.assertEqual(len(plot.get_nodes()), 10)
         self.assertEqual(len(plot.get_edges()), 10)
 
+    @pytest.mark.coverage
     def test_node_with_hint_with_multiple_input_nodes(self):
         def my_pow_plus(a, b, c):
             return a**b + c
@@ -234,22 +342,404 @@ class TestBuilder(unittest.TestCase):
         self.assertEqual(len(plot.get_nodes()), 14)
         self.assertEqual(len(plot.get_edges()), 13)
 
-    def test_node_with_floats(self):
+    def test_repeated_constants_share_a_node(self):
+        builder = Builder()
+        x = builder.init()
+        x_plus_one = builder.add(x, 1)
+        x_plus_two = builder.add(x_plus_one, 1)
+        x_plus_two_float = builder.add(x_plus_two, 1.0)
+        builder.fill_nodes({x: 1, x_plus_two_float: 4})
+        self.assertTrue(builder.check_constraints())
+
+        plot = builder.plot()
+
+        self.assertEqual(len(plot.get_nodes()), 9)
+        self.assertEqual(len(plot.get_edges()), 9)
+
+    def test_positive_and_negative_zero_constants_are_distinct(self):
+        import math
+
+        def sign(a):
+            return math.copysign(1, a)
+
+        builder = Builder()
+        x = builder.init()
+        x_plus_zero = builder.add(x, 0.0)
+        negative_sign = builder.hint(sign, [-0.0])
+        builder.fill_nodes({x: 1})
+        self.assertTrue(builder.check_constraints())
+        self.assertEqual(builder.get_graph_results()[negative_sign.id], -1.0)
+
+        plot = builder.plot()
+        labels = {node.get_label() for node in plot.get_nodes()}
+
+        self.assertIn("0.0", labels)
+        self.assertIn("-0.0", labels)
+
+    def test_assert_equal_binds_constant_operand(self):
+        builder = Builder()
+        x = builder.init()
+        constant_first = builder.assert_equal(2, x)
+        constant_second = builder.assert_equal(x, 2)
+
+        for _, needs, provides, _ in builder.operations:
+            self.assertEqual(needs, (x.id,))
+
+        builder.fill_nodes({x: 2})
+        self.assertTrue(builder.check_constraints())
+        self.assertTrue(builder.get_graph_results()[constant_first.id])
+        self.assertTrue(builder.get_graph_results()[constant_second.id])
+
+        plot = builder.plot()
+        labels = {node.get_name(): node.get_label() for node in plot.get_nodes()}
+        constant_edges = [
+            (edge.get_source(), edge.get_destination())
+            for edge in plot.get_edges()
+            if edge.get_destination().startswith("equal") and edge.get_source() != x.id
+        ]
+
+        self.assertEqual(len(labels), 6)
+        self.assertEqual(len(constant_edges), 2)
+        self.assertEqual({labels[source] for source, _ in constant_edges}, {"2"})
+        self.assertEqual(constant_edges[0][0], constant_edges[1][0])
+
+        builder.fill_nodes({x: 3})
+        self.assertFalse(builder.check_constraints())
+        self.assertEqual(
+            [
+                FAILED_ASSERTION_MSG.format(
+                    label=constant_first.id, a_label="2", b_label=x.id
+                ),
+                FAILED_ASSERTION_MSG.format(
+                    label=constant_second.id, a_label=x.id, b_label="2"
+                ),
+            ],
+            self.handler.messages,
+        )
+
+    def test_plot_after_adding_operations(self):
+        builder = Builder()
+        x = builder.init()
+        x_plus_one = builder.add(x, 1)
+        builder.fill_nodes({x: 1})
+
+        plot = builder.plot()
+
+        self.assertEqual(len(plot.get_nodes()), 4)
+        self.assertEqual(len(plot.get_edges()), 3)
+
+        x_plus_two = builder.add(x_plus_one, 1)
+        builder.fill_nodes({x_plus_two: 3})
+
+        plot = builder.plot()
+
+        self.assertEqual(len(plot.get_nodes()), 6)
+        self.assertEqual(len(plot.get_edges()), 6)
+        self.assertEqual(builder.get_graph_results()[x_plus_two.id], 3)
+
+    def test_operations_run_in_construction_order(self):
+        order = []
+
+        def record(label):
+            def fn(*args):
+                order.append(label)
+                return sum(args)
+
+            return fn
+
+        builder = Builder()
+        x = builder.init()
+        y = builder.hint(record("y"), [x])
+        z = builder.hint(record("z"), [x, 1])
+        w = builder.hint(record("w"), [z, y])
+        builder.fill_nodes({x: 1})
+        self.assertTrue(builder.check_constraints())
+
+        self.assertEqual(order, ["y", "z", "w"])
+        self.assertEqual(builder.get_graph_results()[w.id], 3)
+        available = set(builder.inputs)
+        for _, needs, provides, _ in builder.operations:
+            self.assertTrue(available.issuperset(needs))
+            available.add(provides)
+
+    def test_node_names_are_interned(self):
+        builder = Builder()
+        x = builder.init(name="".join(["x", " + 1"]))
+        y = builder.add(x, 1, name="".join(["x", " + 1"]))
+
+        self.assertIs(x.name, y.name)
+
+    def test_long_chain_of_operations(self):
+        builder = Builder()
+        x = builder.init()
+        y = x
+        for _ in range(1000):
+            y = builder.add(y, 1)
+        builder.fill_nodes({x: 0, y: 1000})
+        self.assertTrue(builder.check_constraints())
+        # The constant 1 is added once, after the first result node.
+        self.assertEqual(y.id, "1001")
+
+    def test_plot_reuses_last_constraint_check(self):
+        calls = []
+
+        def identity(a):
+            calls.append(a)
+            return a
+
+        builder = Builder()
+        x = builder.init()
+        y = builder.hint(identity, [x])
+        builder.fill_nodes({x: 1})
+        self.assertTrue(builder.check_constraints())
+        self.assertEqual(len(calls), 1)
+
+        builder.plot()
+        self.assertEqual(len(calls), 1)
+
+        builder.fill_nodes({y: 1})
+        builder.plot()
+        self.assertEqual(len(calls), 2)
+
+
+class TestSimpleGraph(LogCapturingTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.builder = Builder()
+        cls.x = cls.builder.init()
+        one = cls.builder.constant(1)
+        cls.x_plus_one = cls.builder.add(cls.x, one)
+
+    def setUp(self):
+        super().setUp()
+        self.builder.reset_values()
+
+    @pytest.mark.coverage
+    def test_simple_graph(self):
+        builder = self.builder
+        builder.fill_nodes({self.x: 1})
+        self.assertTrue(builder.check_constraints())
+        self.assertEqual(builder.get_graph_results()[self.x.id], 1)
+        self.assertEqual(builder.get_graph_results()[self.x_plus_one.id], 2)
+
+        plot = builder.plot()
+
+        self.assertEqual(len(plot.get_nodes()), 4)
+        self.assertEqual(len(plot.get_edges()), 3)
+
+    def test_plot_is_reused_until_graph_changes(self):
+        builder = self.builder
+        builder.fill_nodes({self.x: 1})
+
+        plot = builder.plot()
+
+        self.assertIs(builder.plot(), plot)
+        self.assertIsNot(builder.plot(layout_quality="fast"), plot)
+
+        builder.fill_nodes({self.x: 2})
+        refilled_plot = builder.plot()
+
+        self.assertIsNot(refilled_plot, plot)
+        self.assertEqual(refilled_plot.get_node("0")[0].get_label(), "0 = 2")
+
+    def test_reset_values(self):
+        builder = self.builder
+        builder.fill_nodes({self.x: 1})
+        self.assertTrue(builder.check_constraints())
+
+        builder.reset_values()
+
+        self.assertFalse(builder.check_constraints())
+        self.assertEqual(
+            [UNDEFINED_NODE_MSG.format(label="0")],
+            self.handler.messages,
+        )
+        self.assertEqual([ErrorCode.UNDEFINED_NODE], self.handler.codes)
+
+    @pytest.mark.coverage
+    def test_unsupported_file_extension_exception(self):
+        self.builder.fill_nodes({self.x: 1})
+
+        with self.assertRaises(UnsupportedPlotFileExtension) as error:
+            self.builder.plot(filename="my_chart.foo")
+
+        self.assertEqual(
+            UNSUPPORTED_PLOT_FILE_EXTENSION_MSG.format(ext=".foo"), str(error.exception)
+        )
+        self.assertEqual(
+            ErrorCode.UNSUPPORTED_PLOT_FILE_EXTENSION, error.exception.code
+        )
+
+    @pytest.mark.coverage
+    def test_plot_to_image_file_pipes_dot_source_to_graphviz(self):
+        self.builder.fill_nodes({self.x: 1})
+
+        with tempfile.TemporaryDirectory() as directory:
+            dot_filename = os.path.join(directory, "x_plus_one.dot")
+            png_filename = os.path.join(directory, "x_plus_one.png")
+            self.builder.plot(filename=dot_filename)
+
+            with open(dot_filename, "rb") as f:
+                dot_source = f.read()
+
+            with mock.patch("src.builder.subprocess.run") as run:
+                run.return_value.stdout = b"rendered png"
+                self.builder.plot(filename=png_filename)
+
+            with open(png_filename, "rb") as f:
+                png_contents = f.read()
+
+        run.assert_called_once_with(
+            ["dot", "-Tpng"], input=dot_source, stdout=subprocess.PIPE, check=True
+        )
+        self.assertEqual(png_contents, b"rendered png")
+
+    def test_failed_render_keeps_existing_plot_file(self):
+        self.builder.fill_nodes({self.x: 1})
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "x_plus_one.svg")
+            with open(filename, "wb") as f:
+                f.write(b"previous svg")
+
+            with mock.patch(
+                "src.builder.subprocess.run",
+                side_effect=subprocess.CalledProcessError(1, ["dot", "-Tsvg"]),
+            ):
+                with self.assertRaises(subprocess.CalledProcessError):
+                    self.builder.plot(filename=filename)
+
+            with open(filename, "rb") as f:
+                svg_contents = f.read()
+
+        self.assertEqual(svg_contents, b"previous svg")
+
+    def test_plot_with_fast_layout(self):
+        self.builder.fill_nodes({self.x: 1})
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "x_plus_one.dot")
+            plot = self.builder.plot(filename=filename, layout_quality="fast")
+
+            with open(filename) as f:
+                dot_source = f.read()
+
+        self.assertIn("graph [nslimit=0.5, mclimit=0.5, splines=line];", dot_source)
+        self.assertEqual(plot.get_splines(), "line")
+        self.assertEqual(len(plot.get_nodes()), 4)
+
+    @pytest.mark.coverage
+    def test_unsupported_layout_quality_exception(self):
+        self.builder.fill_nodes({self.x: 1})
+
+        with self.assertRaises(UnsupportedLayoutQuality) as error:
+            self.builder.plot(layout_quality="pretty")
+
+        self.assertEqual(
+            UNSUPPORTED_LAYOUT_QUALITY_MSG.format(layout_quality="pretty"),
+            str(error.exception),
+        )
+        self.assertEqual(ErrorCode.UNSUPPORTED_LAYOUT_QUALITY, error.exception.code)
+
+
+class TestMulGraph(LogCapturingTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.builder = Builder()
+        cls.x = cls.builder.init()
+        x_squared = cls.builder.mul(cls.x, cls.x)
+        x_squared_plus_five = cls.builder.add(x_squared, 5)
+        cls.y = cls.builder.add(x_squared_plus_five, cls.x)
+
+    def setUp(self):
+        super().setUp()
+        self.builder.reset_values()
+
+    def test_node_mul_node_with_automatic_constant_node_creation(self):
+        builder = self.builder
+        builder.fill_nodes({self.x: 2, self.y: 11})
+        self.assertTrue(builder.check_constraints())
+        self.assertEqual(builder.get_graph_results()[self.x.id], 2)
+        self.assertEqual(builder.get_graph_results()[self.y.id], 11)
+
+        plot = builder.plot()
+
+        self.assertEqual(len(plot.get_nodes()), 8)
+        self.assertEqual(len(plot.get_edges()), 8)
+
+    def test_node_mul_node_with_different_input(self):
+        builder = self.builder
+        builder.fill_nodes({self.x: 3, self.y: 17})
+        self.assertTrue(builder.check_constraints())
+        self.assertEqual(builder.get_graph_results()[self.y.id], 17)
+
+
+class TestHintGraph(LogCapturingTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        def divide_by_eight(a):
+            return a / 8
+
+        cls.builder = Builder()
+        cls.a = cls.builder.init()
+        cls.b = cls.builder.add(cls.a, 1)
+        cls.c = cls.builder.hint(divide_by_eight, [cls.b])
+        cls.c_times_8 = cls.builder.mul(cls.c, 8)
+        cls.builder.assert_equal(cls.b, cls.c_times_8)
+
+    def setUp(self):
+        super().setUp()
+        self.builder.reset_values()
+
+    @pytest.mark.coverage
+    def test_node_with_hint(self):
+        builder = self.builder
+        builder.fill_nodes({self.a: 2})
+        self.assertTrue(builder.check_constraints())
+        self.assertEqual(builder.get_graph_results()[self.a.id], 2)
+        self.assertEqual(builder.get_graph_results()[self.c.id], 0.375)
+        self.assertEqual(builder.get_graph_results()[self.c_times_8.id], 3)
+
+        plot = builder.plot()
+
+        self.assertEqual(len(plot.get_nodes()), 11)
+        self.assertEqual(len(plot.get_edges()), 11)
+
+
+class TestFloatsGraph(LogCapturingTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
         def my_pow(a, b):
             return a**b
 
-        builder = Builder()
-        x = builder.init(name="x")
-        y = builder.init(name="y")
-        x_pow_y = builder.hint(my_pow, [x, y], name="x^y")
-        x_pow_y_plus_one = builder.add(x_pow_y, 1, name="x^y + 1")
-        builder.assert_equal(0.25, x_pow_y, name="0.25 = x^y")
-        builder.assert_equal(1.25, x_pow_y_plus_one, name="1.25 = x^y + 1")
+        cls.builder = Builder()
+        cls.x = cls.builder.init(name="x")
+        cls.y = cls.builder.init(name="y")
+        cls.x_pow_y = cls.builder.hint(my_pow, [cls.x, cls.y], name="x^y")
+        cls.x_pow_y_plus_one = cls.builder.add(cls.x_pow_y, 1, name="x^y + 1")
+        cls.builder.assert_equal(0.25, cls.x_pow_y, name="0.25 = x^y")
+        cls.builder.assert_equal(1.25, cls.x_pow_y_plus_one, name="1.25 = x^y + 1")
+
+    def setUp(self):
+        super().setUp()
+        self.builder.reset_values()
 
-        builder.fill_nodes({x: 0.5, y: 2})
+    def test_node_with_floats(self):
+        builder = self.builder
+        builder.fill_nodes({self.x: 0.5, self.y: 2})
         self.assertTrue(builder.check_constraints())
-        self.assertEqual(builder.get_graph_results()[x_pow_y.id], 0.25)
-        self.assertEqual(builder.get_graph_results()[x_pow_y_plus_one.id], 1.25)
+        self.assertEqual(builder.get_graph_results()[self.x_pow_y.id], 0.25)
+        self.assertEqual(builder.get_graph_results()[self.x_pow_y_plus_one.id], 1.25)
 
         plot = builder.plot()
 